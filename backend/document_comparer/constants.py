@@ -3,6 +3,10 @@ Module with global contants
 """
 import re
 
-HEADING_PATTERN = re.compile(r"^((?:[1-9]{1}\d*\.*)+\d*)\s*([A-Z0-9][A-Za-z]+.*)")
+# Heading number is written without nested quantifiers,
+# so long digit runs do not cause exponential backtracking
+HEADING_PATTERN = re.compile(r"^([1-9]\d*(?:\.+[1-9]\d*)*(?:\.+\d*)?)\s*([A-Z0-9][A-Za-z]+.*)")
 JUNK_PATTERN = re.compile(r'[-|_|\*\s]')
+JUNK_CHARS = "-|_*"
 HARD_RECURSION_ITER_COEFF = 200
+PARALLEL_REPORT_THRESHOLD = 500
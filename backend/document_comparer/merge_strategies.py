@@ -123,9 +123,8 @@ def _check_item_for_join(pairs: List[ParagraphMatch], position, side="left", dir
         para_compare: Paragraph | None = getattr(pairs[idx], compare_attr)
         if para_compare is None:
             return idx, 0, joined_para
-        joined_text = base_para.text + " " + \
-            para_orig.text if direction > 0 else para_orig.text + \
-            " " + base_para.text
+        joined_text = (f"{base_para.text} {para_orig.text}" if direction > 0
+                       else f"{para_orig.text} {base_para.text}")
         updated_ratio = fuzz.ratio(joined_text, para_compare.text)
         return idx, updated_ratio - pairs[idx].ratio, Paragraph(id=para_compare.id,
                                                                 text=joined_text,
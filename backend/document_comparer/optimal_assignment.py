@@ -2,48 +2,134 @@
 Module for optimal assignment
 """
 
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 from scipy.optimize import linear_sum_assignment
-from rapidfuzz import fuzz
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from rapidfuzz import fuzz, process
 
 from document_comparer.paragraph import Paragraph
 
 
 def find_optimal_matches(score_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Find optimal matches for score matrix
+    Find optimal matches for score matrix.
+    Rows and columns without any positive score cannot add to the total,
+    so they are left out of the assignment problem.
+    Groups of rows and columns that share no positive scores with each other
+    are independent and solved separately
     """
-    row_idx, col_idx = linear_sum_assignment(score_matrix, maximize=True)
-    return row_idx, col_idx
+    n_rows, n_cols = score_matrix.shape
+    edge_rows, edge_cols = np.nonzero(score_matrix)
+    if edge_rows.size == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    graph = coo_matrix((np.ones(edge_rows.size, dtype=np.int8), (edge_rows, edge_cols + n_rows)),
+                       shape=(n_rows + n_cols, n_rows + n_cols))
+    n_groups, labels = connected_components(graph, directed=False)
+    row_labels, col_labels = labels[:n_rows], labels[n_rows:]
+    row_counts = np.bincount(row_labels, minlength=n_groups)
+    col_counts = np.bincount(col_labels, minlength=n_groups)
 
+    # Groups of one row and one column are matched directly
+    single = (row_counts == 1) & (col_counts == 1)
+    col_by_label = np.zeros(n_groups, dtype=np.intp)
+    col_by_label[col_labels] = np.arange(n_cols)
+    single_rows = np.flatnonzero(single[row_labels])
+    row_parts = [single_rows]
+    col_parts = [col_by_label[row_labels[single_rows]]]
 
-def calculate_score_matrix(texts_left: List[Paragraph], texts_right: List[Paragraph]) -> np.ndarray:
+    row_order = np.argsort(row_labels, kind="stable")
+    col_order = np.argsort(col_labels, kind="stable")
+    row_bounds = np.searchsorted(row_labels[row_order], np.arange(n_groups + 1))
+    col_bounds = np.searchsorted(col_labels[col_order], np.arange(n_groups + 1))
+    for label in np.flatnonzero((row_counts > 0) & (col_counts > 0) & ~single):
+        group_rows = row_order[row_bounds[label]:row_bounds[label + 1]]
+        group_cols = col_order[col_bounds[label]:col_bounds[label + 1]]
+        row_idx, col_idx = linear_sum_assignment(score_matrix[np.ix_(group_rows, group_cols)],
+                                                 maximize=True)
+        row_parts.append(group_rows[row_idx])
+        col_parts.append(group_cols[col_idx])
+
+    row_idx = np.concatenate(row_parts)
+    col_idx = np.concatenate(col_parts)
+    order = np.argsort(row_idx)
+    return row_idx[order], col_idx[order]
+
+
+def calculate_score_matrix(strings_left: Sequence[str],
+                           strings_right: Sequence[str]) -> np.ndarray:
     """
-    Calculate score matrix based on fuzzy matching ratio for two lists of texts
+    Calculate score matrix based on fuzzy matching ratio for two lists of texts.
+    All scores are kept, the assignment needs the low ones too
     """
-    score_matrix = np.zeros((len(texts_left), len(texts_right)))
-    for i, text1 in enumerate(texts_left):
-        for j, text2 in enumerate(texts_right):
-            score_matrix[i][j] = fuzz.ratio(text1.text, text2.text)
+    return process.cdist(strings_left, strings_right,
+                         scorer=fuzz.ratio,
+                         dtype=np.float64,
+                         workers=-1)
+
+
+def update_score_matrix(strings_left: Sequence[str], strings_right: Sequence[str],
+                        prev_strings_left: Sequence[str], prev_strings_right: Sequence[str],
+                        prev_score_matrix: np.ndarray) -> np.ndarray:
+    """
+    Calculate score matrix reusing scores of the texts that were
+    already scored in the previous matrix
+    """
+    prev_rows = {text: idx for idx, text in enumerate(prev_strings_left)}
+    prev_cols = {text: idx for idx, text in enumerate(prev_strings_right)}
+    known_rows = [i for i, text in enumerate(strings_left) if text in prev_rows]
+    known_cols = [j for j, text in enumerate(strings_right) if text in prev_cols]
+    new_rows = [i for i, text in enumerate(strings_left) if text not in prev_rows]
+    new_cols = [j for j, text in enumerate(strings_right) if text not in prev_cols]
+
+    score_matrix = np.empty((len(strings_left), len(strings_right)))
+    score_matrix[np.ix_(known_rows, known_cols)] = prev_score_matrix[np.ix_(
+        [prev_rows[strings_left[i]] for i in known_rows],
+        [prev_cols[strings_right[j]] for j in known_cols])]
+    if new_rows:
+        score_matrix[new_rows, :] = calculate_score_matrix(
+            [strings_left[i] for i in new_rows], strings_right)
+    if known_rows and new_cols:
+        score_matrix[np.ix_(known_rows, new_cols)] = calculate_score_matrix(
+            [strings_left[i] for i in known_rows],
+            [strings_right[j] for j in new_cols])
     return score_matrix
 
 
 def compute_optimal_matches(texts_left: List[Paragraph],
                             texts_right: List[Paragraph],
                             ratio_threshold: float,
-                            consider_partial=False) -> List[Tuple[int, Paragraph, int, Paragraph, float]]:
+                            consider_partial=False,
+                            strings_left: Optional[Sequence[str]] = None,
+                            strings_right: Optional[Sequence[str]] = None,
+                            score_matrix: Optional[np.ndarray] = None
+                            ) -> List[Tuple[int, Paragraph, int, Paragraph, float]]:
     """
     Compute optimal matches using score matrix and Hungarian algorithm.
     Only return matches exceeding the ratio threshold.
+
+    Plain texts of the paragraphs can be passed with strings_left
+    and strings_right to avoid extracting them again.
+    Score matrix calculated in advance can be passed with score_matrix
     """
-    score_matrix = calculate_score_matrix(texts_left, texts_right)
+    if strings_left is None:
+        strings_left = [para.text for para in texts_left]
+    if strings_right is None:
+        strings_right = [para.text for para in texts_right]
+    if score_matrix is None:
+        # Scores under the threshold still decide the assignment,
+        # so the matrix is not cut off, only the matches are filtered
+        score_matrix = calculate_score_matrix(strings_left, strings_right)
     row_idx, col_idx = find_optimal_matches(score_matrix)
-    return [(i, texts_left[i], j, texts_right[j], score_matrix[i][j])
-            for i, j in zip(row_idx, col_idx)
-            if score_matrix[i][j] > ratio_threshold or
-            (consider_partial
-             and score_matrix[i][j] > ratio_threshold / 2
-             and fuzz.partial_ratio(texts_left[i].text,                       # type: ignore
-                                    texts_right[j].text) > ratio_threshold)]
+    scores = score_matrix[row_idx, col_idx]
+    keep = scores > ratio_threshold
+    if consider_partial:
+        for k in np.flatnonzero(~keep & (scores > ratio_threshold / 2)):
+            keep[k] = fuzz.partial_ratio(strings_left[row_idx[k]],
+                                         strings_right[col_idx[k]]) > ratio_threshold
+    return [(i, texts_left[i], j, texts_right[j], score)
+            for i, j, score in zip(row_idx[keep].tolist(),
+                                   col_idx[keep].tolist(),
+                                   scores[keep].tolist())]
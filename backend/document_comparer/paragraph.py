@@ -6,17 +6,18 @@ from dataclasses import field, dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """
-    Paragraph class with fields for text, id and other attributes
+    Paragraph class with fields for text, id and other attributes.
+    Slots keep many small sentence paragraphs cheap to create and hold
     """
     text: str
     id: str
     payload: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParagraphMatch:
     """
     Match of two paragraphs
@@ -3,28 +3,63 @@ Module to match collections of texts
 """
 
 import logging
-from typing import List, Tuple, Callable, Any
+import operator
+import os
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from typing import Dict, Iterable, Iterator, List, Tuple, Callable, Any
 
-from Levenshtein import opcodes as match_opcodes
+import numpy as np
+from rapidfuzz.distance import Levenshtein
 
 from document_comparer.merge_strategies import (join_optimize_paragraph_matches,
                                                 matched_condition,
                                                 merge_matches_on_condition,
                                                 unmatched_condition_no_id,
                                                 unmatched_condition_with_id)
-from document_comparer.optimal_assignment import compute_optimal_matches
-from document_comparer.constants import JUNK_PATTERN
+from document_comparer.optimal_assignment import (calculate_score_matrix,
+                                                   compute_optimal_matches,
+                                                   update_score_matrix)
+from document_comparer.constants import PARALLEL_REPORT_THRESHOLD
 from document_comparer.paragraph import Paragraph, ParagraphMatch
 from document_comparer.paragraph_utils import sorted_paragraphs
-from document_comparer.utils import split_texts_into_sentences
+from document_comparer.utils import remove_junk, split_texts_into_sentences
 from internal.constants import COMPLETE_MERGE, COMPLETE_SECOND, COMPLETE_SPLIT
 from internal.notifier import Notifier
+from internal.process_pool import get_process_pool, reset_process_pool
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
 
 COMPLETE_MIDDLE = (COMPLETE_SPLIT + COMPLETE_SECOND) // 2
 
+DELETE_OPEN = '<span style="color: #FF3131;text-decoration: line-through;">'
+REPLACE_OPEN = '<span style="color: #FFBF00;">'
+INSERT_OPEN = '<span style="color: #50C878;">'
+SPAN_CLOSE = '</span>'
+
+
+@lru_cache(maxsize=8192)
+def _edit_operations(text_left: str, text_right: str) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Edit operations of a pair, cached because matched pairs are
+    checked for changes first and reported afterwards
+    """
+    return Levenshtein.opcodes(text_left, text_right).as_list()
+
+
+def _make_worker_report(report_method: Callable[[str, str], Tuple[Any, Any]],
+                        text_left: str, text_right: str) -> Tuple[Any, Any]:
+    """
+    Make report in a pool worker. Workers get unique pairs and live
+    longer than one comparison, so their edit operations are not kept
+    """
+    try:
+        return report_method(text_left, text_right)
+    finally:
+        _edit_operations.cache_clear()
+
 
 class TextMatcher:
     """
@@ -41,48 +76,136 @@ class TextMatcher:
         """
         Constructor of text matcher instance
         """
-        self.texts_left: List[Paragraph] = texts_left
-        self.texts_right: List[Paragraph] = texts_right
+        self.texts_left = texts_left
+        self.texts_right = texts_right
         self.ratio_threshold = ratio_threshold * 100
         self.update_ratio_threshold = 99.0
         self.length_threshold = length_threshold
         self.file_type_left = file_type_left
         self.file_type_right = file_type_right
-        self.notifier = notifier        
+        self.notifier = notifier
+        self._score_cache: Tuple[List[str], List[str], np.ndarray] | None = None
+        self._matches_cache: Tuple[List[Paragraph], List[Paragraph], float, bool,
+                                   List[Tuple[int, Paragraph, int, Paragraph, float]]] | None = None
 
-    def find_closest_match(self, match_positions: List[int], text_position: int, step: int) -> int:
+    @property
+    def texts_left(self) -> List[Paragraph]:
+        """
+        Paragraphs of the left document
+        """
+        return self._texts_left
+
+    @texts_left.setter
+    def texts_left(self, texts: List[Paragraph]):
+        self._texts_left = texts
+        self._texts_left_str = [para.text for para in texts]
+
+    @property
+    def texts_right(self) -> List[Paragraph]:
+        """
+        Paragraphs of the right document
+        """
+        return self._texts_right
+
+    @texts_right.setter
+    def texts_right(self, texts: List[Paragraph]):
+        self._texts_right = texts
+        self._texts_right_str = [para.text for para in texts]
+
+    def _get_score_matrix(self) -> np.ndarray:
+        """
+        Get score matrix for current texts.
+        Scores of texts that did not change since the previous call are reused
+        """
+        if self._score_cache is not None:
+            prev_strings_left, prev_strings_right, prev_score_matrix = self._score_cache
+            score_matrix = update_score_matrix(self._texts_left_str, self._texts_right_str,
+                                               prev_strings_left, prev_strings_right,
+                                               prev_score_matrix)
+        else:
+            score_matrix = calculate_score_matrix(self._texts_left_str,
+                                                  self._texts_right_str)
+        self._score_cache = (self._texts_left_str, self._texts_right_str, score_matrix)
+        return score_matrix
+
+    def _compute_optimal_matches(self, ratio_threshold: float,
+                                 consider_partial=False) -> List[Tuple[int, Paragraph, int, Paragraph, float]]:
+        """
+        Compute optimal matches for current texts.
+        If the same paragraphs were matched with the same settings
+        in the previous call, its matches are returned again
+        """
+        if self._matches_cache is not None:
+            prev_left, prev_right, prev_threshold, prev_partial, prev_matches = self._matches_cache
+            if (prev_threshold == ratio_threshold and prev_partial == consider_partial
+                    and self._same_paragraphs(prev_left, self.texts_left)
+                    and self._same_paragraphs(prev_right, self.texts_right)):
+                return prev_matches
+        optimal_matches = compute_optimal_matches(
+            self.texts_left, self.texts_right, ratio_threshold,
+            consider_partial=consider_partial,
+            strings_left=self._texts_left_str,
+            strings_right=self._texts_right_str,
+            score_matrix=self._get_score_matrix())
+        self._matches_cache = (self.texts_left, self.texts_right,
+                               ratio_threshold, consider_partial, optimal_matches)
+        return optimal_matches
+
+    @staticmethod
+    def _same_paragraphs(paragraphs: List[Paragraph], other_paragraphs: List[Paragraph]) -> bool:
+        """
+        Check that both lists hold the same paragraph objects in the same order
+        """
+        return (len(paragraphs) == len(other_paragraphs)
+                and all(map(operator.is_, paragraphs, other_paragraphs)))
+
+    @staticmethod
+    def sort_match_positions(match_positions: List[int]) -> Tuple[List[int], List[int]]:
+        """
+        Sort match positions keeping their original indices
+        """
+        indices = sorted(range(len(match_positions)),
+                         key=match_positions.__getitem__)
+        return [match_positions[idx] for idx in indices], indices
+
+    def find_closest_match(self, match_positions: List[int], text_position: int, step: int,
+                           sorted_matches: Tuple[List[int], List[int]] | None = None) -> int:
         """
         Find the index of the closest match given a list of match positions.
         Returns -1 if no valid match is found.
+        Result of sort_match_positions can be passed with sorted_matches
+        to avoid sorting positions on every call
         """
-        if step == 0:
+        if step == 0 or not match_positions:
             return -1
-        limit_position = min(
-            match_positions) if step < 0 else max(match_positions)
-        match_positions_set = set(match_positions)
-        current_position = text_position
-        while current_position not in match_positions_set:
-            current_position += step
-            if (step < 0 and current_position < limit_position) or (step > 0 and current_position > limit_position):
-                return -1
-        return match_positions.index(current_position)
+        if sorted_matches is None:
+            sorted_matches = self.sort_match_positions(match_positions)
+        positions, indices = sorted_matches
+        if step < 0:
+            pos = bisect_right(positions, text_position) - 1
+            return indices[pos] if pos >= 0 else -1
+        pos = bisect_left(positions, text_position)
+        return indices[pos] if pos < len(positions) else -1
 
     @classmethod
     def get_edit_operations(cls, text_left: str, text_right: str):
         """
         Get edit operations using Levenshtein
         """
-        return match_opcodes(text_left, text_right)
+        if text_left == text_right:
+            return [("equal", 0, len(text_left), 0, len(text_right))] if text_left else []
+        return _edit_operations(text_left, text_right)
 
     @classmethod
     def is_changed(cls, tag: str, subtext_left: str, subtext_right: str) -> bool:
         """
         Determine if text was changed (ignoring junk)
         """
-        if tag == 'equal':
+        if tag == 'equal' or subtext_left == subtext_right:
             return False
-        clean_left = JUNK_PATTERN.sub('', subtext_left)
-        clean_right = JUNK_PATTERN.sub('', subtext_right)
+        # Inserted or deleted parts have one empty side, nothing to clean there
+        clean_left = remove_junk(subtext_left) if subtext_left else ''
+        clean_right = remove_junk(subtext_right) if subtext_right else ''
         return clean_left != clean_right
 
     @classmethod
@@ -98,6 +221,7 @@ class TextMatcher:
             sub_right = text_right[j1:j2]
             if not (sub_left.strip() or sub_right.strip()):
                 subchanges.append(False)
+                continue
             # Determine if the text has changed
             sub_changed = cls.is_changed(tag, sub_left, sub_right)
             subchanges.append(sub_changed)
@@ -106,64 +230,92 @@ class TextMatcher:
     @classmethod
     def is_fully_changed(cls, text_left: str, text_right: str):
         """
-        Check if text is fully changed
+        Check if text is fully changed.
+        Stops at the first changed part instead of collecting all subchanges
         """
-        subchanges = cls.get_subchanges(text_left, text_right)
-        return any(subchanges)
+        if text_left == text_right:
+            return False
+        for tag, i1, i2, j1, j2 in cls.get_edit_operations(text_left, text_right):
+            if cls.is_changed(tag, text_left[i1:i2], text_right[j1:j2]):
+                return True
+        return False
 
     @classmethod
-    def _get_report(cls, text_left: str, text_right: str,
-                    formatter: Callable[[str, str, str], Tuple[Any, Any]]) -> Tuple[Any, Any]:
+    def _get_report_html(cls, text_left: str, text_right: str) -> Tuple[List[str], List[str]]:
         """
-        Private helper that runs over the edit operations and formats reports.
-        The formatter callback is responsible for processing one opcode.
+        Run over the edit operations and wrap changed parts into HTML tags.
+        Reports are returned as string pieces to be joined at once
         """
-        opcodes = cls.get_edit_operations(text_left, text_right)
-        report_left = []
-        report_right = []
-        subchanges = cls.get_subchanges(text_left, text_right, opcodes)
-        for (tag, i1, i2, j1, j2), sub_changed in zip(opcodes, subchanges):
+        report_left: List[str] = []
+        report_right: List[str] = []
+        for tag, i1, i2, j1, j2 in cls.get_edit_operations(text_left, text_right):
             sub_left = text_left[i1:i2]
             sub_right = text_right[j1:j2]
             if not (sub_left.strip() or sub_right.strip()):
                 continue
             # When content is visually the same, treat as equal
-            if tag != 'equal' and not sub_changed:
-                tag = 'equal'
-            left_part, right_part = formatter(tag, sub_left, sub_right)
-            report_left.append(left_part)
-            report_right.append(right_part)
+            if not cls.is_changed(tag, sub_left, sub_right):
+                report_left.append(sub_left)
+                report_right.append(sub_right)
+            elif tag == "delete":
+                report_left += (DELETE_OPEN, sub_left, SPAN_CLOSE)
+                report_right.append(sub_right)
+            elif tag == "replace":
+                report_left += (REPLACE_OPEN, sub_left, SPAN_CLOSE)
+                report_right += (REPLACE_OPEN, sub_right, SPAN_CLOSE)
+            elif tag == "insert":
+                report_left.append(sub_left)
+                report_right += (INSERT_OPEN, sub_right, SPAN_CLOSE)
         return report_left, report_right
 
     @classmethod
-    def _html_formatter(cls, tag: str, sub_left: str, sub_right: str) -> Tuple[str, str]:
+    def _get_report_json(cls, text_left: str, text_right: str) -> Tuple[List[dict], List[dict]]:
         """
-        Formatter for HTML reporting
+        Run over the edit operations and make tagged subtexts
         """
-        if tag == "delete":
-            sub_left = f'<span style="color: #FF3131;text-decoration: line-through;">{sub_left}</span>'
-        elif tag == "replace":
-            sub_left = f'<span style="color: #FFBF00;">{sub_left}</span>'
-            sub_right = f'<span style="color: #FFBF00;">{sub_right}</span>'
-        elif tag == "insert":
-            sub_right = f'<span style="color: #50C878;">{sub_right}</span>'
-        return sub_left, sub_right
+        report_left: List[dict] = []
+        report_right: List[dict] = []
+        for tag, i1, i2, j1, j2 in cls.get_edit_operations(text_left, text_right):
+            sub_left = text_left[i1:i2]
+            sub_right = text_right[j1:j2]
+            if not (sub_left.strip() or sub_right.strip()):
+                continue
+            # When content is visually the same, treat as equal
+            if not cls.is_changed(tag, sub_left, sub_right):
+                tag = "equal"
+            report_left.append({"tag": tag, "subtext": sub_left})
+            report_right.append({"tag": tag, "subtext": sub_right})
+        return report_left, report_right
 
     @classmethod
-    def _json_formatter(cls, tag: str, sub_left: str,
-                        sub_right: str) -> Tuple[dict, dict]:
+    def _get_one_sided_tag(cls, text_left: str, text_right: str) -> str | None:
         """
-        Formatter for JSON reporting
+        Get tag of a pair where one text is empty, without running the diff.
+        Whole text is then a single delete or insert, or equal if it is junk
         """
-        return {"tag": tag, "subtext": sub_left}, {"tag": tag, "subtext": sub_right}
+        if text_left and text_right:
+            return None
+        tag = "insert" if text_right else "delete"
+        return tag if remove_junk(text_left or text_right) else "equal"
 
     @classmethod
     def get_match_html_report(cls, text_left: str, text_right: str) -> Tuple[str, str]:
         """
         Get match report with HTML tags
         """
-        report_left, report_right = cls._get_report(
-            text_left, text_right, cls._html_formatter)
+        if text_left == text_right:
+            # Identical texts have no tags to add
+            return (text_left, text_right) if text_left.strip() else ("", "")
+        tag = cls._get_one_sided_tag(text_left, text_right)
+        if tag is not None:
+            if not (text_left or text_right).strip():
+                return "", ""
+            if tag == "delete":
+                return DELETE_OPEN + text_left + SPAN_CLOSE, text_right
+            if tag == "insert":
+                return text_left, INSERT_OPEN + text_right + SPAN_CLOSE
+            return text_left, text_right
+        report_left, report_right = cls._get_report_html(text_left, text_right)
         return "".join(report_left), "".join(report_right)
 
     @classmethod
@@ -171,16 +323,16 @@ class TextMatcher:
         """
         Get match report as JSON
         """
-        return cls._get_report(text_left, text_right, cls._json_formatter)
-
-    @classmethod
-    def get_match_tags(cls, matched_texts_left: List[Paragraph],
-                       matched_texts_right: List[Paragraph]):
-        """
-        Get match tags (or opcodes) for each pair
-        """
-        return [cls.get_edit_operations(l.text, r.text)
-                for l, r in zip(matched_texts_left, matched_texts_right)]
+        if text_left == text_right:
+            if not text_left.strip():
+                return [], []
+            return [{"tag": "equal", "subtext": text_left}], [{"tag": "equal", "subtext": text_right}]
+        tag = cls._get_one_sided_tag(text_left, text_right)
+        if tag is not None:
+            if not (text_left or text_right).strip():
+                return [], []
+            return [{"tag": tag, "subtext": text_left}], [{"tag": tag, "subtext": text_right}]
+        return cls._get_report_json(text_left, text_right)
 
     def _update_segment(self, texts: List[Paragraph], pos: int, new_segments: List[Paragraph]) -> List[Paragraph]:
         """
@@ -188,18 +340,33 @@ class TextMatcher:
         """
         return texts[:pos] + new_segments + texts[pos + 1:]
 
+    @staticmethod
+    def unzip_matches(optimal_matches: List[Tuple[int, Paragraph, int, Paragraph, float]]
+                      ) -> Tuple[List[int], List[Paragraph], List[int], List[Paragraph], List[float]]:
+        """
+        Split optimal matches into parallel lists of
+        left positions, left paragraphs, right positions, right paragraphs and ratios
+        """
+        if not optimal_matches:
+            return [], [], [], [], []
+        positions_left, paragraphs_left, positions_right, paragraphs_right, ratios = zip(
+            *optimal_matches)
+        return (list(positions_left), list(paragraphs_left),
+                list(positions_right), list(paragraphs_right), list(ratios))
+
     def get_unmatched_texts_indices(self, match_positions_left: List[int],
                                     match_positions_right: List[int]):
         """
         Get indices of the unmatched texts. 
         These are texts that were potentially removed or added
         """
-        texts_left_indices = list(range(len(self.texts_left)))
-        texts_right_indices = list(range(len(self.texts_right)))
-        # Remove indices already matched optimally
-        for pos_left, pos_right in zip(match_positions_left, match_positions_right):
-            texts_left_indices.remove(pos_left)
-            texts_right_indices.remove(pos_right)
+        # Skip indices already matched optimally
+        matched_left = np.zeros(len(self.texts_left), dtype=bool)
+        matched_right = np.zeros(len(self.texts_right), dtype=bool)
+        matched_left[match_positions_left] = True
+        matched_right[match_positions_right] = True
+        texts_left_indices: List[int] = np.flatnonzero(~matched_left).tolist()
+        texts_right_indices: List[int] = np.flatnonzero(~matched_right).tolist()
         return texts_left_indices, texts_right_indices
 
     def split_paragraphs(self, paragraphs: List[Paragraph]) -> List[Paragraph]:
@@ -210,7 +377,8 @@ class TextMatcher:
         updated_paragraphs: List[Paragraph] = []
         texts_it = split_texts_into_sentences(para_it)
         for para, texts in zip(paragraphs, texts_it):
-            updated_paragraphs += [Paragraph(text=text, id=para.id, payload={**para.payload, "sent_pos": i})
+            para_id, para_payload = para.id, para.payload
+            updated_paragraphs += [Paragraph(text=text, id=para_id, payload={**para_payload, "sent_pos": i})
                                    for i, text in enumerate(texts)]
         return updated_paragraphs
 
@@ -251,13 +419,10 @@ class TextMatcher:
         """
         Update paragraphs by splitting into sentences those that were unmatched        
         """
-        optimal_matches = compute_optimal_matches(
-            self.texts_left, self.texts_right, self.update_ratio_threshold)
+        optimal_matches = self._compute_optimal_matches(self.update_ratio_threshold)
         # Extract positions from optimal matches for easier lookup
-        match_positions_left = [match[0] for match in optimal_matches]
-        updated_paragraphs_left = [match[1] for match in optimal_matches]
-        match_positions_right = [match[2] for match in optimal_matches]
-        updated_paragraphs_right = [match[3] for match in optimal_matches]
+        (match_positions_left, updated_paragraphs_left,
+         match_positions_right, updated_paragraphs_right, _) = self.unzip_matches(optimal_matches)
 
         texts_left_indices, texts_right_indices = self.get_unmatched_texts_indices(
             match_positions_left, match_positions_right
@@ -285,12 +450,10 @@ class TextMatcher:
         Match paragraph with right order
         """
         threshold = self.ratio_threshold if is_final else self.update_ratio_threshold
-        optimal_matches = compute_optimal_matches(
-            self.texts_left, self.texts_right, threshold,
-            consider_partial=is_final)
+        optimal_matches = self._compute_optimal_matches(threshold, is_final)
 
-        match_positions_left = [match[0] for match in optimal_matches]
-        match_positions_right = [match[2] for match in optimal_matches]
+        match_positions_left, _, match_positions_right, _, _ = self.unzip_matches(
+            optimal_matches)
 
         texts_left_indices, texts_right_indices = self.get_unmatched_texts_indices(
             match_positions_left, match_positions_right
@@ -318,10 +481,11 @@ class TextMatcher:
                                   paragraph_right=None)
             result.append(item)
 
+        sorted_matches_right = self.sort_match_positions(match_positions_right)
         for idx in texts_right_indices:
             text_right = self.texts_right[idx]
             closest_match_index = self.find_closest_match(
-                match_positions_right, idx, -1) if match_positions_right else -1
+                match_positions_right, idx, -1, sorted_matches_right)
             if closest_match_index != -1:
                 pos_left = optimal_matches[closest_match_index][0]
                 pos_right = optimal_matches[closest_match_index][2]
@@ -337,45 +501,90 @@ class TextMatcher:
 
         return sorted(result, key=lambda x: (x.position, x.position_secondary))
 
-    def generate_comparison(self, mode: str = "html"):
+    @classmethod
+    def make_reports(cls, report_method: Callable[[str, str], Tuple[Any, Any]],
+                     texts_left: List[str], texts_right: List[str]) -> Iterable[Tuple[Any, Any]]:
+        """
+        Make reports for pairs of texts.
+        Large comparisons are distributed over worker processes,
+        because the report loop holds the GIL.
+        Otherwise reports are made lazily while iterating
+        """
+        workers = os.cpu_count() or 1
+        if workers == 1 or len(texts_left) < PARALLEL_REPORT_THRESHOLD:
+            return cls._iter_reports(report_method, texts_left, texts_right)
+        # Repeated pairs (e.g. page headers and footers) are reported once
+        unique_pairs = list(dict.fromkeys(zip(texts_left, texts_right)))
+        chunksize = -(-len(unique_pairs) // (4 * workers))
+        try:
+            unique_reports = dict(zip(unique_pairs, get_process_pool().map(
+                partial(_make_worker_report, report_method), *zip(*unique_pairs),
+                chunksize=chunksize)))
+        except BrokenProcessPool:
+            reset_process_pool()
+            raise
+        return [unique_reports[pair] for pair in zip(texts_left, texts_right)]
+
+    @staticmethod
+    def _iter_reports(report_method: Callable[[str, str], Tuple[Any, Any]],
+                      texts_left: List[str], texts_right: List[str]) -> Iterator[Tuple[Any, Any]]:
+        """
+        Make reports lazily. Only reports of repeated pairs are kept to be reused
+        """
+        pair_counts = Counter(zip(texts_left, texts_right))
+        repeated_reports: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+        for pair in zip(texts_left, texts_right):
+            if pair_counts[pair] == 1:
+                yield report_method(*pair)
+                continue
+            if pair not in repeated_reports:
+                repeated_reports[pair] = report_method(*pair)
+            yield repeated_reports[pair]
+
+    def generate_comparison(self, mode: str = "html") -> List[Dict[str, Any]]:
         """
         Generate comparison object        
         """
-        # Run the splitting phase twice
+        return list(self.iter_comparison(mode))
+
+    def iter_comparison(self, mode: str = "html") -> Iterator[Dict[str, Any]]:
+        """
+        Generate comparison items one by one
+        """
+        # Split unmatched paragraphs into sentences, then merge them back.
+        # If nothing was split, merging reuses matches of the splitting phase
         self.update_split_paragraphs()
         self.update_merge_paragraphs()
 
         paragraph_matches: List[ParagraphMatch] = self.make_paragraph_matches(
             True)
 
-        comparison_obj = []
-
         # Select reporting method based on mode
         report_method: Callable[[str, str], Tuple[Any, Any]] = (
             self.get_match_html_report if mode == "html" else self.get_match_json_report
         )
 
-        for match_item in paragraph_matches:
-            paragraph_left = (match_item.paragraph_left
-                              if match_item.paragraph_left
-                              else Paragraph("", ""))
-            paragraph_right = (match_item.paragraph_right
-                               if match_item.paragraph_right
-                               else Paragraph("", ""))
-            report_left, report_right = report_method(
-                paragraph_left.text, paragraph_right.text)
-            item = {
+        # Missing sides are reported as an empty paragraph with empty id
+        empty_paragraph = Paragraph("", "")
+        paragraph_pairs = [(match_item.paragraph_left or empty_paragraph,
+                            match_item.paragraph_right or empty_paragraph)
+                           for match_item in paragraph_matches]
+        reports = self.make_reports(report_method,
+                                    [pair[0].text for pair in paragraph_pairs],
+                                    [pair[1].text for pair in paragraph_pairs])
+
+        for match_item, (paragraph_left, paragraph_right), (report_left, report_right) in zip(
+                paragraph_matches, paragraph_pairs, reports):
+            yield {
                 "ratio": round(match_item.ratio / 100, 4),
                 "type": match_item.type,
-                "text_left_id": match_item.paragraph_left.id if match_item.paragraph_left else "",
+                "text_left_id": paragraph_left.id,
                 "text_left": paragraph_left.text,
-                "text_right_id": match_item.paragraph_right.id if match_item.paragraph_right else "",
+                "text_right_id": paragraph_right.id,
                 "text_right": paragraph_right.text,
                 "text_left_report": report_left,
                 "text_right_report": report_right,
                 "page_number_left": str(paragraph_left.payload.get("page_number", "")),
                 "page_number_right": str(paragraph_right.payload.get("page_number", ""))
             }
-            comparison_obj.append(item)
-
-        return comparison_obj
+        _edit_operations.cache_clear()
@@ -8,3 +8,15 @@ COMPLETE_SECOND = 52
 COMPLETE_SPLIT = 70
 COMPLETE_MERGE = 97
 COMPLETE_COMPARE = 99
+
+# Cached results larger than this (in bytes) are compressed
+COMPRESS_RESULT_THRESHOLD = 64 * 1024
+
+# Task progress, results and request keys are kept this long (in seconds)
+TASK_TTL = 3 * 60 * 60
+
+# Failed tasks keep their status only long enough to be polled (in seconds)
+FAILED_TASK_TTL = 300
+
+# Number of parsed documents kept to be reused by repeated comparisons
+PARAGRAPH_CACHE_SIZE = 16
@@ -2,9 +2,8 @@
 Module for Notifier
 """
 
-from dataclasses import dataclass
-import math
-from typing import Optional, TypedDict
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, TypedDict
 
 from internal.temp_storage import TempStorage
 
@@ -16,14 +15,27 @@ class Notifier:
     """
     task_id: Optional[str]
     temp_store: Optional[TempStorage]
+    _last_sent: Tuple[int | float, str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def is_noop(self) -> bool:
+        """
+        Notifier without task or storage does nothing
+        """
+        return self.temp_store is None or self.task_id is None
 
     def notify(self, progress: int | float, status: str = "processing"):
         """
         Notify progress change
         """
-        if self.temp_store is None or self.task_id is None:
+        if self.is_noop:
             return
-        self.temp_store.cache_progress(self.task_id, progress, status)
+        # Expiry is set by the first and the final notifications,
+        # updates in between keep it
+        refresh_ttl = self._last_sent is None or status != "processing"
+        self.temp_store.cache_progress(self.task_id, progress, status,
+                                       refresh_ttl)
+        self._last_sent = (progress, status)
 
     def loop_notify(self, iteration: int, lower: int,
                     upper: int, max_iter: int,
@@ -31,7 +43,12 @@ class Notifier:
         """
         Notify progress in the loop
         """
-        progress = lower + math.floor(iteration * (upper - lower) / max_iter)
+        if self.is_noop:
+            return
+        progress = lower + iteration * (upper - lower) // max_iter
+        # Progress moves slower than loops, skip writes that change nothing
+        if (progress, status) == self._last_sent:
+            return
         self.notify(progress, status)
 
 class ThresholdNotifier(TypedDict):
@@ -0,0 +1,46 @@
+"""
+Module for process pool shared by comparisons
+"""
+
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing.context import BaseContext
+
+
+def get_pool_context() -> BaseContext:
+    """
+    Get context to start pool workers.
+    Forking the threaded server process could leave locks held by other threads
+    locked in the workers, so workers are started by a fork server where it exists
+    (not on Windows) and spawned otherwise
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    # Workers forked from the server get the heavy modules already imported
+    context.set_forkserver_preload(["document_comparer.pdf_processor",
+                                    "document_comparer.text_matcher"])
+    return context
+
+
+@lru_cache(maxsize=1)
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get process pool.
+    One pool is kept for the process lifetime, so workers are not started for every comparison
+    """
+    pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=get_pool_context())
+    atexit.register(pool.shutdown)
+    return pool
+
+
+def reset_process_pool():
+    """
+    Drop current process pool, e.g. after a worker died, next call creates a new one
+    """
+    if get_process_pool.cache_info().currsize:
+        get_process_pool().shutdown(wait=False, cancel_futures=True)
+    get_process_pool.cache_clear()
@@ -2,11 +2,21 @@
 Module for temporary storage
 """
 import os
-from typing import Hashable, List, Dict, Any, Tuple  # pylint: disable=deprecated-class
-import json
+import re
+import zlib
+from functools import lru_cache
+from typing import Hashable, Iterable, List, Dict, Any, Tuple  # pylint: disable=deprecated-class
 
+import orjson
 from redis import Redis
 
+from internal.constants import COMPRESS_RESULT_THRESHOLD, FAILED_TASK_TTL, TASK_TTL
+
+CONN_STRING_PATTERN = re.compile(r"([^:]*):(\d+),([^,]*)")
+
+# Marks compressed results, JSON itself never starts with this byte
+COMPRESSED_MARK = b"\x01"
+
 
 class TempStorage:
     """
@@ -27,19 +37,50 @@ class TempStorage:
 
     def cache_progress(self, task_id: str,
                        progress: int|float,
-                       status: str = "processing"):
+                       status: str = "processing",
+                       refresh_ttl: bool = True):
         """
-        Cache progress of the operation
+        Cache progress of the operation.
+        Progress and status are fields of one hash per task.
+        Without refresh_ttl the hash keeps expiry set by earlier calls,
+        expiry is only set if the hash has none (e.g. it expired meanwhile)
         """
-        self.provider.set(f"progress:{task_id}", progress, ex=10800)
-        self.provider.set(f"status:{task_id}", status, ex=10800)
+        if refresh_ttl:
+            self.cache_progress_many([(task_id, progress, status)])
+            return
+        with self.provider.pipeline(transaction=False) as pipe:
+            pipe.hset(f"task:{task_id}", mapping={"progress": progress, "status": status})
+            pipe.expire(f"task:{task_id}", TASK_TTL, nx=True)
+            pipe.execute()
+
+    def cache_progress_many(self, items: Iterable[Tuple[str, int | float, str]]):
+        """
+        Cache progress of several updates in one round trip
+        """
+        with self.provider.pipeline(transaction=False) as pipe:
+            for task_id, progress, status in items:
+                pipe.hset(f"task:{task_id}",
+                          mapping={"progress": progress, "status": status})
+                pipe.expire(f"task:{task_id}", TASK_TTL)
+            pipe.execute()
+
+    def mark_failed(self, task_id: str):
+        """
+        Mark the operation as failed.
+        Failed status is kept shortly and partial result is freed at once
+        """
+        with self.provider.pipeline(transaction=False) as pipe:
+            pipe.unlink(f"result:{task_id}")
+            pipe.hset(f"task:{task_id}", mapping={"progress": -1, "status": "failed"})
+            pipe.expire(f"task:{task_id}", FAILED_TASK_TTL)
+            pipe.execute()
 
     def get_progress(self, task_id: str) -> Tuple[int | None, str | None]:
         """
         Get progress status
         """
-        progress = self.provider.get(f"progress:{task_id}")
-        status = self.provider.get(f"status:{task_id}")
+        progress, status = self.provider.hmget(f"task:{task_id}",
+                                               "progress", "status")
         if progress is None or status is None:
             return None, None
         try:
@@ -47,12 +88,27 @@ class TempStorage:
         except ValueError:
             return None, None
 
-    def cache_result(self, task_id: str, dataset: List[Dict[Hashable, Any]]):
+    def cache_result(self, task_id: str, dataset: List[Dict[Hashable, Any]],
+                     request_key: str | None = None):
+        """
+        Cache result of the operation.
+        With request_key the task is remembered to answer the same request again
+        """
+        rval = orjson.dumps(dataset)
+        if len(rval) > COMPRESS_RESULT_THRESHOLD:
+            rval = COMPRESSED_MARK + zlib.compress(rval, 1)
+        self.provider.set(f"result:{task_id}", rval, ex=TASK_TTL)
+        if request_key is not None:
+            self.provider.set(f"request:{request_key}", task_id, ex=TASK_TTL)
+
+    def get_request_task(self, request_key: str) -> str | None:
         """
-        Cache result of the operation
+        Get completed task of the same request
         """
-        rval = json.dumps(dataset)
-        self.provider.set(f"result:{task_id}", rval, ex=10800)
+        task_id = self.provider.get(f"request:{request_key}")
+        if task_id is None:
+            return None
+        return task_id.decode()
 
     def get_result(self, task_id: str) -> List[Dict[Hashable, Any]] | None:
         """
@@ -61,26 +117,30 @@ class TempStorage:
         data = self.provider.get(f"result:{task_id}")
         if data is None:
             return None
-        return json.loads(data)
+        if data[:1] == COMPRESSED_MARK:
+            data = zlib.decompress(data[1:])
+        return orjson.loads(data)
 
 
 def parse_conn_string(conn_string):
     """
     Parse Redis connection string
+    given as host:port,password=...[,other options].
+    Other strings are returned as they are
     """
-    try:
-        split_conn_string = conn_string.partition(":")
-        redis_host = split_conn_string[0]
-        redis_port = int(split_conn_string[2].split(",")[0])
-        redis_pw = split_conn_string[2].split(",")[1].replace("password=", "")
-        return f"rediss://:{redis_pw}@{redis_host}:{redis_port}/0?ssl_cert_reqs=required"
-    except (ValueError, IndexError):
+    match = CONN_STRING_PATTERN.match(conn_string)
+    if match is None:
         return conn_string
+    redis_host, redis_port, redis_pw = match.groups()
+    redis_pw = redis_pw.replace("password=", "")
+    return f"rediss://:{redis_pw}@{redis_host}:{int(redis_port)}/0?ssl_cert_reqs=required"
 
 
+@lru_cache(maxsize=1)
 def get_storage() -> TempStorage:
     """
-    Get temporary storage
+    Get temporary storage.
+    One storage with its connection pool is shared by all requests
     """
     connection_string = parse_conn_string(os.environ.get("REDIS_CONNECTION",
                                                          "redis://127.0.0.1:6379"))
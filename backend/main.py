@@ -3,18 +3,31 @@ Entry for FastAPI backend
 """
 
 import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 from routers import compare
+from use_cases.processor_factory import warmup_processors
 
 logging.basicConfig(level=logging.INFO)
 
 pdf_logger = logging.getLogger("pdfminer")
 pdf_logger.setLevel(logging.ERROR)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """
+    Prepare processors before serving requests
+    """
+    warmup_processors()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
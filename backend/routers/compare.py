@@ -1,14 +1,16 @@
 """
 Routers for comparsion tasks
 """
+import asyncio
+import hashlib
 import logging
+import math
 import os
-import shutil
 import tempfile
-from typing import Annotated
+from typing import Annotated, Any, Dict, Tuple
 from uuid import uuid4
 
-import pandas as pd
+import anyio
 from fastapi import (APIRouter, BackgroundTasks, Depends, File, Form,
                      HTTPException, UploadFile)
 from internal.constants import INIT_PROGRESS
@@ -17,6 +19,7 @@ from internal.schemas import (CompareRequest, CompareResponse,
                               ProgressResponse, TaskIdResponse)
 from internal.temp_storage import TempStorage, get_storage
 from use_cases import compare_documents
+from use_cases.compare_documents import new_content_hash
 from use_cases.processor_factory import detect_file_type_on_name
 
 logger = logging.getLogger(__name__)
@@ -28,21 +31,21 @@ router = APIRouter(
 
 
 @router.post("/start-task/")
-def start_task(background_tasks: BackgroundTasks,
-               temp_store: Annotated[TempStorage, Depends(get_storage)],
-               header_left: int = Form(40), footer_left: int = Form(40),
-               size_weight_left: float = Form(0.8), header_right: int = Form(40),
-               footer_right: int = Form(40), size_weight_right: float = Form(0.8),
-               ratio_threshold: float = Form(0.5), length_threshold: int = Form(30),
-               text_column_left: str = Form(''), text_column_right: str = Form(''),
-               id_column_left: str = Form(''), id_column_right: str = Form(''),
-               left_file: UploadFile = File(...),
-               right_file: UploadFile = File(...)) -> TaskIdResponse:
+async def start_task(background_tasks: BackgroundTasks,
+                     temp_store: Annotated[TempStorage, Depends(get_storage)],
+                     header_left: int = Form(40), footer_left: int = Form(40),
+                     size_weight_left: float = Form(0.8), header_right: int = Form(40),
+                     footer_right: int = Form(40), size_weight_right: float = Form(0.8),
+                     ratio_threshold: float = Form(0.5), length_threshold: int = Form(30),
+                     text_column_left: str = Form(''), text_column_right: str = Form(''),
+                     id_column_left: str = Form(''), id_column_right: str = Form(''),
+                     left_file: UploadFile = File(...),
+                     right_file: UploadFile = File(...)) -> TaskIdResponse:
     """
     Upload files and make a comparison report
     """
 
-    task_id = str(uuid4())
+    task_id = uuid4().hex
     args = CompareRequest(header_left=header_left,
                           header_right=header_right,
                           footer_left=footer_left,
@@ -56,15 +59,35 @@ def start_task(background_tasks: BackgroundTasks,
                           id_column_left=id_column_left,
                           id_column_right=id_column_right)
 
-    left_path = save_upload_file_tmp(left_file)
-    right_path = save_upload_file_tmp(right_file)
+    saved = await asyncio.gather(save_upload_file_tmp(left_file),
+                                 save_upload_file_tmp(right_file),
+                                 return_exceptions=True)
+    errors = [result for result in saved if isinstance(result, BaseException)]
+    if errors:
+        # Remove the file that was saved before the other one failed
+        for result in saved:
+            if not isinstance(result, BaseException):
+                os.remove(result[0])
+        raise errors[0]
+    (left_path, left_hash), (right_path, right_hash) = saved
+
+    # Same files with the same settings are answered by the completed task
+    request_key = get_request_key(left_hash, right_hash, args)
+    completed_task_id = await anyio.to_thread.run_sync(temp_store.get_request_task,
+                                                       request_key)
+    if completed_task_id is not None:
+        os.remove(left_path)
+        os.remove(right_path)
+        return TaskIdResponse(task_id=completed_task_id)
 
     background_tasks.add_task(run_comparison_task,
                               task_id,
                               left_path,
                               right_path,
                               args,
-                              temp_store)
+                              temp_store,
+                              request_key,
+                              (left_hash, right_hash))
     return TaskIdResponse(task_id=task_id)
 
 
@@ -99,10 +122,14 @@ def run_comparison_task(task_id: str,
                         left_path: str,
                         right_path: str,
                         args: CompareRequest,
-                        temp_store: TempStorage):
+                        temp_store: TempStorage,
+                        request_key: str | None = None,
+                        content_hashes: Tuple[str, str] | None = None):
     """
-    Comparison task runner
+    Comparison task runner.
+    Content hashes of the saved files are reused to find their parsed paragraphs
     """
+    left_hash, right_hash = content_hashes or (None, None)
     notifier = Notifier(temp_store=temp_store, task_id=task_id)
     left_file_type = detect_file_type_on_name(left_path)
     right_file_type = detect_file_type_on_name(right_path)
@@ -113,18 +140,18 @@ def run_comparison_task(task_id: str,
                                        right_path,
                                        right_file_type,
                                        args, notifier=notifier,
-                                       mode="json")
-        comparison = (pd.DataFrame.from_records(comparison)
-                      .fillna("")
-                      ).to_dict("records")
+                                       mode="json",
+                                       left_hash=left_hash,
+                                       right_hash=right_hash)
+        comparison = [fill_missing_values(record) for record in comparison]
 
-        temp_store.cache_result(task_id, comparison)
+        temp_store.cache_result(task_id, comparison, request_key)
         notifier.notify(99, "completed")
     except (IOError, ValueError) as ex:
         logger.warning("Handled error: %s", ex)
-        temp_store.cache_progress(task_id, -1, "failed")
+        temp_store.mark_failed(task_id)
     except Exception as ex:  # pylint: disable=broad-exception-caught
-        temp_store.cache_progress(task_id, -1, "failed")  # indicate failure
+        temp_store.mark_failed(task_id)  # indicate failure
         logger.error("Unknown error occured in comparison task : %s %s",
                      type(ex), str(ex))
     finally:
@@ -132,15 +159,41 @@ def run_comparison_task(task_id: str,
         os.remove(right_path)
 
 
-def save_upload_file_tmp(upload_file: UploadFile) -> str:
+async def save_upload_file_tmp(upload_file: UploadFile) -> Tuple[str, str]:
     """
-    Save uploaded file to a temporary location
+    Save uploaded file to a temporary location and get its content hash.
+    File is copied in 1 MiB chunks without blocking the event loop
     """
     filename = upload_file.filename
     if not filename:
         raise HTTPException(status_code=400, detail="Filename is not provided")
     suffix = os.path.splitext(filename)[-1]
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        shutil.copyfileobj(upload_file.file, tmp)
-        tmp_path = tmp.name
-    return tmp_path
+    tmp_fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+    os.close(tmp_fd)
+    content_hash = new_content_hash()
+    try:
+        async with await anyio.open_file(tmp_path, "wb") as tmp:
+            while chunk := await upload_file.read(1 << 20):
+                content_hash.update(chunk)
+                await tmp.write(chunk)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return tmp_path, content_hash.hexdigest()
+
+
+def get_request_key(left_hash: str, right_hash: str, args: CompareRequest) -> str:
+    """
+    Get key of comparison request: content hashes of both files and settings
+    """
+    return hashlib.blake2b(f"{left_hash}:{right_hash}:{args.model_dump_json()}".encode(),
+                           digest_size=16).hexdigest()
+
+
+def fill_missing_values(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace missing values (None or NaN) in the record with empty strings
+    """
+    return {key: "" if value is None or (isinstance(value, float) and math.isnan(value))
+            else value
+            for key, value in record.items()}
@@ -0,0 +1,29 @@
+"""
+Module to test string alignment
+"""
+
+from document_comparer.utils import align_end, align_start
+
+
+def test_align_start():
+    """
+    Test start moves over spaces only
+    """
+
+    text = "ab   cd "
+
+    assert align_start(2, text) == 5
+    assert align_start(0, text) == 0
+    assert align_start(7, text) == 8
+
+
+def test_align_end():
+    """
+    Test end moves back over spaces only
+    """
+
+    text = " ab   cd"
+
+    assert align_end(5, text) == 2
+    assert align_end(7, text) == 7
+    assert align_end(0, text) == -1
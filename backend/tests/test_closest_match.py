@@ -0,0 +1,48 @@
+"""
+Module to test search of the closest match
+"""
+
+from document_comparer.text_matcher import TextMatcher
+
+
+def make_matcher():
+    """
+    Helper to create empty text matcher
+    """
+    return TextMatcher([], [], 0.5, 80)
+
+
+def test_closest_match_backward():
+    """
+    Test closest match before the position in unsorted positions
+    """
+    matcher = make_matcher()
+    positions = [4, 1, 9, 6]
+
+    assert matcher.find_closest_match(positions, 5, -1) == 0
+    assert matcher.find_closest_match(positions, 8, -1) == 3
+    assert matcher.find_closest_match(positions, 0, -1) == -1
+
+
+def test_closest_match_forward():
+    """
+    Test closest match after the position in unsorted positions
+    """
+    matcher = make_matcher()
+    positions = [4, 1, 9, 6]
+
+    assert matcher.find_closest_match(positions, 5, 1) == 3
+    assert matcher.find_closest_match(positions, 2, 1) == 0
+    assert matcher.find_closest_match(positions, 10, 1) == -1
+
+
+def test_closest_match_presorted():
+    """
+    Test closest match with positions sorted in advance
+    """
+    matcher = make_matcher()
+    positions = [4, 1, 9, 6]
+    sorted_matches = matcher.sort_match_positions(positions)
+
+    assert matcher.find_closest_match(positions, 7, -1, sorted_matches) == 3
+    assert matcher.find_closest_match([], 7, -1) == -1
@@ -0,0 +1,33 @@
+"""
+Module to test file type detection
+"""
+
+from io import BytesIO
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from use_cases.processor_factory import detect_file_type, detect_file_type_on_name
+
+
+def test_detect_file_type_on_name():
+    """
+    Test file type is detected by the last extension of the file name
+    """
+    assert detect_file_type_on_name("/tmp/tmpa1b2.pdf") == "pdf"
+    assert detect_file_type_on_name("report.v2.xlsx") == "excel"
+    assert detect_file_type_on_name("table.xls") == "unknown"
+    assert detect_file_type_on_name("folder.pdf/file") == "unknown"
+
+
+def test_detect_file_type_falls_back_to_name():
+    """
+    Test content type is used first and file name only when it is unknown
+    """
+    def upload(filename, content_type):
+        return UploadFile(BytesIO(), filename=filename,
+                          headers=Headers({"content-type": content_type}))
+
+    assert detect_file_type(upload("table.bin", "application/vnd.ms-excel")) == "excel"
+    assert detect_file_type(upload("doc.pdf", "application/octet-stream")) == "pdf"
+    assert detect_file_type(upload("doc.txt", "text/plain")) == "unknown"
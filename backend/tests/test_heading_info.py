@@ -0,0 +1,35 @@
+"""
+Module to test heading recognition
+"""
+
+from document_comparer.utils import get_heading_info
+
+
+def test_heading_info_numbered():
+    """
+    Test heading with multilevel number
+    """
+    text = "2.10.3 Scope of work. The contractor shall deliver"
+
+    assert get_heading_info(text) == ("2.10.3", "Scope of work")
+
+
+def test_heading_info_number_glued_to_text():
+    """
+    Test heading where last digit of the number starts heading text
+    """
+    assert get_heading_info("123abc def. Next") == ("12", "3abc def")
+
+
+def test_heading_info_no_heading():
+    """
+    Test text without heading number
+    """
+    assert get_heading_info("0.5 percent of total") == ("", "")
+
+
+def test_heading_info_long_number():
+    """
+    Test long digit run without heading is recognized without backtracking
+    """
+    assert get_heading_info("1" * 200 + " total amount") == ("", "")
@@ -0,0 +1,190 @@
+"""
+Module to test match reports
+"""
+
+from document_comparer.constants import JUNK_PATTERN
+from document_comparer.text_matcher import (DELETE_OPEN, INSERT_OPEN, REPLACE_OPEN,
+                                            SPAN_CLOSE, TextMatcher)
+from document_comparer.utils import remove_junk
+
+
+def html_formatter(tag, sub_left, sub_right):
+    """
+    Reference formatter of one HTML report part
+    """
+    if tag == "delete":
+        sub_left = DELETE_OPEN + sub_left + SPAN_CLOSE
+    elif tag == "replace":
+        sub_left = REPLACE_OPEN + sub_left + SPAN_CLOSE
+        sub_right = REPLACE_OPEN + sub_right + SPAN_CLOSE
+    elif tag == "insert":
+        sub_right = INSERT_OPEN + sub_right + SPAN_CLOSE
+    return sub_left, sub_right
+
+
+def json_formatter(tag, sub_left, sub_right):
+    """
+    Reference formatter of one JSON report part
+    """
+    return {"tag": tag, "subtext": sub_left}, {"tag": tag, "subtext": sub_right}
+
+
+def reference_report(text_left, text_right, formatter):
+    """
+    Reference report built from subchanges, one formatted part per edit operation
+    """
+    opcodes = TextMatcher.get_edit_operations(text_left, text_right)
+    report_left = []
+    report_right = []
+    subchanges = TextMatcher.get_subchanges(text_left, text_right, opcodes)
+    for (tag, i1, i2, j1, j2), sub_changed in zip(opcodes, subchanges):
+        sub_left = text_left[i1:i2]
+        sub_right = text_right[j1:j2]
+        if not (sub_left.strip() or sub_right.strip()):
+            continue
+        if tag != "equal" and not sub_changed:
+            tag = "equal"
+        left_part, right_part = formatter(tag, sub_left, sub_right)
+        report_left.append(left_part)
+        report_right.append(right_part)
+    return report_left, report_right
+
+
+def test_html_report_same_as_formatter():
+    """
+    Test specialized HTML report matches formatter based report
+    """
+    text_left = "The quick brown fox jumps over the lazy dog. It was sunny."
+    text_right = "The quick red fox jumped over a lazy dog. It is sunny today."
+
+    report_left, report_right = TextMatcher.get_match_html_report(
+        text_left, text_right)
+    expected_left, expected_right = reference_report(text_left, text_right, html_formatter)
+
+    assert report_left == "".join(expected_left)
+    assert report_right == "".join(expected_right)
+
+
+def test_json_report_same_as_formatter():
+    """
+    Test specialized JSON report matches formatter based report
+    """
+    text_left = "Section 1. General terms - apply to all parties."
+    text_right = "Section 1. General terms apply to all the parties!"
+
+    report = TextMatcher.get_match_json_report(text_left, text_right)
+    expected = reference_report(text_left, text_right, json_formatter)
+
+    assert report == expected
+
+
+def test_html_report_expected_output():
+    """
+    Test HTML report wraps deleted, replaced and inserted parts
+    """
+    assert TextMatcher.get_match_html_report("Total price - 10 EUR",
+                                             "Total cost 10 EUR net") == (
+        f"Total {DELETE_OPEN}pri{SPAN_CLOSE}c{REPLACE_OPEN}e -{SPAN_CLOSE} 10 EUR",
+        f"Total c{REPLACE_OPEN}ost{SPAN_CLOSE} 10 EUR{INSERT_OPEN} net{SPAN_CLOSE}")
+
+
+def test_json_report_expected_output():
+    """
+    Test JSON report tags every part on both sides
+    """
+    assert TextMatcher.get_match_json_report("Pay in 5 days", "Pay in 10 days") == (
+        [{"tag": "equal", "subtext": "Pay in "}, {"tag": "insert", "subtext": ""},
+         {"tag": "replace", "subtext": "5"}, {"tag": "equal", "subtext": " days"}],
+        [{"tag": "equal", "subtext": "Pay in "}, {"tag": "insert", "subtext": "1"},
+         {"tag": "replace", "subtext": "0"}, {"tag": "equal", "subtext": " days"}])
+
+
+def test_html_report_equal_texts():
+    """
+    Test HTML report for equal texts has no tags
+    """
+    text = "Nothing has changed here"
+
+    assert TextMatcher.get_match_html_report(text, text) == (text, text)
+
+
+def test_json_report_equal_texts():
+    """
+    Test JSON report for equal texts is a single equal part
+    """
+    text = "Nothing has changed here"
+
+    assert TextMatcher.get_match_json_report(text, text) == TextMatcher._get_report_json(  # pylint: disable=protected-access
+        text, text)
+    assert TextMatcher.get_match_json_report("  ", "  ") == ([], [])
+
+
+def test_remove_junk_same_as_pattern():
+    """
+    Test junk removal gives the same result as junk pattern
+    """
+    text = "Total -  price |\t10_000\u00a0*\nEUR"
+
+    assert remove_junk(text) == JUNK_PATTERN.sub("", text) == "Totalprice10000EUR"
+
+
+def test_reports_one_sided_texts():
+    """
+    Test reports with one empty text are the same as formatter based reports
+    """
+    for text_left, text_right in [("", "New paragraph"), ("Removed one", ""),
+                                  ("", " -- | "), ("***", ""), ("", "  \n")]:
+        expected_left, expected_right = reference_report(text_left, text_right,
+                                                         html_formatter)
+        assert TextMatcher.get_match_html_report(text_left, text_right) == (
+            "".join(expected_left), "".join(expected_right))
+        assert TextMatcher.get_match_json_report(text_left, text_right) == reference_report(
+            text_left, text_right, json_formatter)
+
+
+def test_make_reports_repeated_pairs():
+    """
+    Test reports of repeated pairs are made once and kept in order
+    """
+    calls = []
+
+    def report_method(text_left, text_right):
+        calls.append((text_left, text_right))
+        return TextMatcher.get_match_html_report(text_left, text_right)
+
+    texts_left = ["Page 1", "Body one", "Page 1", "", "Body two"]
+    texts_right = ["Page 2", "Body 1", "Page 2", "Footer", "Body two"]
+
+    reports = list(TextMatcher.make_reports(report_method, texts_left, texts_right))
+
+    assert reports == [TextMatcher.get_match_html_report(l, r)
+                       for l, r in zip(texts_left, texts_right)]
+    assert len(calls) == 4
+
+
+def test_is_fully_changed_same_as_subchanges():
+    """
+    Test early stopping change check agrees with collected subchanges
+    """
+    pairs = [("ab c", "a bc"), ("Price - 10", "Price 10"), ("Same", "Same"),
+             ("Old text", "New text"), ("", "  "), ("a-b", "ab-")]
+    for text_left, text_right in pairs:
+        assert TextMatcher.is_fully_changed(text_left, text_right) == any(
+            TextMatcher.get_subchanges(text_left, text_right))
+
+
+def test_subchanges_aligned_with_opcodes():
+    """
+    Test there is exactly one subchange per edit operation
+    """
+    text_left = "Total  amount: 100 EUR"
+    text_right = "Total amount:  120 USD"
+
+    opcodes = TextMatcher.get_edit_operations(text_left, text_right)
+    subchanges = TextMatcher.get_subchanges(text_left, text_right, opcodes)
+
+    assert len(subchanges) == len(opcodes)
+    assert subchanges == [
+        bool((text_left[i1:i2].strip() or text_right[j1:j2].strip())
+             and TextMatcher.is_changed(tag, text_left[i1:i2], text_right[j1:j2]))
+        for tag, i1, i2, j1, j2 in opcodes]
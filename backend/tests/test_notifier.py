@@ -0,0 +1,77 @@
+"""
+Module to test notifier
+"""
+
+from internal.notifier import Notifier
+
+
+class StorageStub:
+    """
+    Storage that records cached progress
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.ttl_refreshes = 0
+
+    def cache_progress(self, task_id, progress, status="processing", refresh_ttl=True):
+        """
+        Record progress
+        """
+        self.calls.append((task_id, progress, status))
+        self.ttl_refreshes += refresh_ttl
+
+
+def test_loop_notify_skips_same_progress():
+    """
+    Test only changed progress is written in the loop
+    """
+    storage = StorageStub()
+    notifier = Notifier("task", storage)  # type: ignore
+
+    for iteration in range(1000):
+        notifier.loop_notify(iteration, 10, 20, 1000)
+
+    assert [progress for _, progress, _ in storage.calls] == list(range(10, 20))
+
+
+def test_notify_always_writes():
+    """
+    Test direct notifications are written even with the same progress
+    """
+    storage = StorageStub()
+    notifier = Notifier("task", storage)  # type: ignore
+
+    notifier.notify(50)
+    notifier.notify(50)
+    notifier.loop_notify(0, 50, 60, 10, "failed")
+
+    assert storage.calls == [("task", 50, "processing"), ("task", 50, "processing"),
+                             ("task", 50, "failed")]
+
+
+def test_notify_refreshes_ttl_on_first_and_final():
+    """
+    Test expiry is refreshed only by the first and non processing notifications
+    """
+    storage = StorageStub()
+    notifier = Notifier("task", storage)  # type: ignore
+
+    for iteration in range(100):
+        notifier.loop_notify(iteration, 0, 50, 100)
+    notifier.notify(99, "completed")
+
+    assert len(storage.calls) == 51
+    assert storage.ttl_refreshes == 2
+
+
+def test_noop_notifier_skips_loop_updates():
+    """
+    Test notifier without storage does nothing, even with zero iterations
+    """
+    notifier = Notifier(None, None)
+
+    assert notifier.is_noop
+    notifier.loop_notify(1, 0, 10, 0)
+    notifier.notify(99)
+    assert not Notifier("task", StorageStub()).is_noop  # type: ignore
@@ -0,0 +1,106 @@
+"""
+Module to test optimal assignment
+"""
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from document_comparer.optimal_assignment import (calculate_score_matrix,
+                                                   compute_optimal_matches,
+                                                   find_optimal_matches,
+                                                   update_score_matrix)
+from document_comparer.paragraph import Paragraph
+
+
+def test_optimal_matches_with_empty_rows_and_columns():
+    """
+    Test that rows and columns without scores do not change optimal total
+    """
+    rng = np.random.default_rng(0)
+    score_matrix = rng.integers(0, 101, (40, 30)).astype(float)
+    score_matrix[::3] = 0
+    score_matrix[:, ::4] = 0
+
+    row_idx, col_idx = find_optimal_matches(score_matrix)
+    expected_row_idx, expected_col_idx = linear_sum_assignment(score_matrix,
+                                                               maximize=True)
+
+    assert len(set(row_idx)) == len(row_idx)
+    assert len(set(col_idx)) == len(col_idx)
+    assert (score_matrix[row_idx, col_idx].sum() ==
+            score_matrix[expected_row_idx, expected_col_idx].sum())
+
+
+def test_optimal_matches_independent_groups():
+    """
+    Test that groups of rows and columns solved separately give optimal total
+    """
+    rng = np.random.default_rng(1)
+    score_matrix = np.zeros((30, 25))
+    score_matrix[:5, :4] = rng.integers(1, 101, (5, 4))
+    score_matrix[5:12, 10:20] = rng.integers(1, 101, (7, 10))
+    score_matrix[np.arange(15, 25), np.arange(4, 14)[::-1]] = 90
+
+    row_idx, col_idx = find_optimal_matches(score_matrix)
+    expected_row_idx, expected_col_idx = linear_sum_assignment(score_matrix,
+                                                               maximize=True)
+
+    assert list(row_idx) == sorted(row_idx)
+    assert len(set(col_idx)) == len(col_idx)
+    assert (score_matrix[row_idx, col_idx].sum() ==
+            score_matrix[expected_row_idx, expected_col_idx].sum())
+
+
+def test_optimal_matches_zero_matrix():
+    """
+    Test that nothing is matched when there are no scores
+    """
+    row_idx, col_idx = find_optimal_matches(np.zeros((3, 4)))
+
+    assert len(row_idx) == 0
+    assert len(col_idx) == 0
+
+
+def test_update_score_matrix_same_as_calculated():
+    """
+    Test that reused scores give the same matrix as a full calculation
+    """
+    prev_left = ["first text", "second text", "third one"]
+    prev_right = ["first txt", "another text", "third"]
+    strings_left = ["third one", "new text here", "first text"]
+    strings_right = ["third", "brand new text", "first txt", "first txt"]
+    prev_score_matrix = calculate_score_matrix(prev_left, prev_right)
+
+    score_matrix = update_score_matrix(strings_left, strings_right,
+                                       prev_left, prev_right,
+                                       prev_score_matrix)
+
+    assert (score_matrix == calculate_score_matrix(strings_left, strings_right)).all()
+
+
+def test_update_score_matrix_nothing_known():
+    """
+    Test score matrix update when no text was scored before
+    """
+    prev_score_matrix = calculate_score_matrix(["a"], ["b"])
+
+    score_matrix = update_score_matrix(["c", "d"], ["e"], ["a"], ["b"],
+                                       prev_score_matrix)
+
+    assert score_matrix.shape == (2, 1)
+    assert (score_matrix == calculate_score_matrix(["c", "d"], ["e"])).all()
+
+
+def test_optimal_matches_use_scores_under_threshold():
+    """
+    Test scores under the threshold still take part in the assignment.
+    Best total pairs "due order" with "total item order" (56 + 47.1),
+    while dropping scores under 50 would pair it with "due paid" (58.8)
+    """
+    texts_left = [Paragraph("due order", "0"), Paragraph("paid date", "1")]
+    texts_right = [Paragraph("total item order", "0"), Paragraph("due paid", "1")]
+
+    matches = compute_optimal_matches(texts_left, texts_right, 50)
+
+    assert [(i, j) for i, _, j, _, _ in matches] == [(0, 0)]
+    assert round(matches[0][4], 1) == 56.0
@@ -0,0 +1,51 @@
+"""
+Module to test cache of parsed documents
+"""
+
+from io import BytesIO
+
+from document_comparer.paragraph import Paragraph
+from internal.constants import PARAGRAPH_CACHE_SIZE
+from internal.schemas import CompareRequestSingle
+from use_cases.compare_documents import (cache_paragraphs, get_cache_key,
+                                         get_cached_paragraphs)
+
+
+def test_cached_paragraphs_are_copies():
+    """
+    Test changes of returned paragraphs do not affect cached ones
+    """
+    key = get_cache_key(BytesIO(b"content"), CompareRequestSingle(), "pdf")
+    paragraphs = [Paragraph("Some text", "1", {"size": 10})]
+
+    cached = cache_paragraphs(key, paragraphs)
+    cached[0].payload["sent_pos"] = [0]
+
+    assert get_cached_paragraphs(key) == paragraphs
+    assert "sent_pos" not in paragraphs[0].payload
+
+
+def test_paragraph_cache_size_is_limited():
+    """
+    Test least recently used documents are dropped from cache
+    """
+    keys = [get_cache_key(BytesIO(str(i).encode()), CompareRequestSingle(), "docx")
+            for i in range(PARAGRAPH_CACHE_SIZE + 1)]
+    for key in keys:
+        cache_paragraphs(key, [])
+
+    assert get_cached_paragraphs(keys[0]) is None
+    assert get_cached_paragraphs(keys[-1]) == []
+
+
+def test_cache_key_keeps_file_position():
+    """
+    Test hashing content leaves the file ready to be parsed
+    """
+    file_object = BytesIO(b"some document content")
+    file_object.seek(5)
+
+    key = get_cache_key(file_object, CompareRequestSingle(), "pdf")
+
+    assert file_object.tell() == 5
+    assert key == get_cache_key(BytesIO(b"some document content"), CompareRequestSingle(), "pdf")
@@ -0,0 +1,53 @@
+"""
+Module to test shared process pool
+"""
+
+import multiprocessing
+
+from document_comparer.text_matcher import (TextMatcher, _edit_operations,  # pylint: disable=protected-access
+                                            _make_worker_report)
+from internal.process_pool import get_pool_context, get_process_pool, reset_process_pool
+
+
+def test_process_pool_is_reused():
+    """
+    Test the same pool serves all calls until it is reset
+    """
+    pool = get_process_pool()
+
+    assert get_process_pool() is pool
+    assert list(pool.map(abs, [-1, 2, -3])) == [1, 2, 3]
+
+    reset_process_pool()
+
+    assert get_process_pool() is not pool
+    reset_process_pool()
+
+
+def test_worker_report_keeps_no_edit_operations():
+    """
+    Test reports made for pool workers leave the edit operations cache empty
+    """
+    report = _make_worker_report(TextMatcher.get_match_html_report, "Old text", "New text")
+
+    assert _edit_operations.cache_info().currsize == 0
+    assert report == TextMatcher.get_match_html_report("Old text", "New text")
+
+
+def test_pool_context_without_fork_server(monkeypatch):
+    """
+    Test workers are spawned where fork server is not available
+    """
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+
+    assert get_pool_context().get_start_method() == "spawn"
+
+
+def test_pool_context_with_fork_server(monkeypatch):
+    """
+    Test fork server is used where it is available
+    """
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods",
+                        lambda: ["fork", "spawn", "forkserver"])
+
+    assert get_pool_context().get_start_method() == "forkserver"
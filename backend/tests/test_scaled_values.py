@@ -0,0 +1,31 @@
+"""
+Module to test scaled values
+"""
+
+import numpy as np
+
+from document_comparer.utils import (get_lower_values, get_upper_values,
+                                     min_max_scale)
+
+
+def test_min_max_scale():
+    """
+    Test scaling between 0 and 1
+    """
+
+    arr = [10, 20, 60, 110]
+
+    expected = [0.0, 0.1, 0.5, 1.0]
+
+    assert np.allclose(min_max_scale(arr), expected)
+
+
+def test_lower_and_upper_values():
+    """
+    Test values lower and upper the thresholds
+    """
+
+    arr = [72.0, 72.5, 90.0, 500.0, 72.0]
+
+    assert get_lower_values(arr).tolist() == [True, True, True, False, True]
+    assert get_upper_values(arr).tolist() == [False, False, False, True, False]
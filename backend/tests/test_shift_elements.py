@@ -0,0 +1,34 @@
+"""
+Module to test shifting of elements
+"""
+
+import numpy as np
+
+from document_comparer.utils import shift_elements
+
+
+def test_shift_elements_forward_and_back():
+    """
+    Test shift in both directions keeps length and dtype
+    """
+
+    arr = np.array([True, False, False, True])
+
+    forward = shift_elements(arr, 1, True)
+    back = shift_elements(arr, -2, True)
+
+    assert forward.tolist() == [True, True, False, False]
+    assert back.tolist() == [False, True, True, True]
+    assert forward.dtype == back.dtype == arr.dtype
+
+
+def test_shift_elements_edge():
+    """
+    Test zero shift and shift longer than array
+    """
+
+    arr = np.array([1, 2, 3])
+
+    assert shift_elements(arr, 0, 0).tolist() == [1, 2, 3]
+    assert shift_elements(arr, 5, 0).tolist() == [0, 0, 0]
+    assert shift_elements(arr, -5, 0).tolist() == [0, 0, 0]
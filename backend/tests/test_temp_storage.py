@@ -0,0 +1,130 @@
+"""
+Module to test temporary storage
+"""
+
+from internal.constants import TASK_TTL
+from internal.temp_storage import COMPRESSED_MARK, TempStorage, parse_conn_string
+
+
+class PipelineStub(list):
+    """
+    Pipeline recording commands sent to provider
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def hset(self, key, mapping):
+        """
+        Record hash update
+        """
+        self.append(("hset", key, mapping))
+
+    def expire(self, key, seconds, nx=False):
+        """
+        Record expiry update
+        """
+        self.append(("expire", key, seconds, nx))
+
+    def execute(self):
+        """
+        Nothing to execute, commands are only recorded
+        """
+
+
+class ProviderStub(dict):
+    """
+    Key value provider kept in memory
+    """
+
+    def set(self, key, value, ex=None):  # pylint: disable=unused-argument
+        """
+        Set value, strings are stored encoded like in Redis
+        """
+        self[key] = value.encode() if isinstance(value, str) else value
+
+    def get(self, key, default=None):
+        """
+        Get value
+        """
+        return super().get(key, default)
+
+    def pipeline(self, transaction=True):  # pylint: disable=unused-argument
+        """
+        Get pipeline, its commands are kept in pipelines list
+        """
+        pipe = PipelineStub()
+        self.setdefault("pipelines", []).append(pipe)
+        return pipe
+
+
+def test_small_result_is_stored_as_json():
+    """
+    Test small result is not compressed
+    """
+    provider = ProviderStub()
+    temp_store = TempStorage(provider)
+    dataset = [{"text_left": "Some text", "ratio": 0.5}]
+
+    temp_store.cache_result("task", dataset)
+
+    assert provider["result:task"][:1] == b"["
+    assert temp_store.get_result("task") == dataset
+
+
+def test_large_result_is_compressed():
+    """
+    Test large result is compressed and read back
+    """
+    provider = ProviderStub()
+    temp_store = TempStorage(provider)
+    dataset = [{"text_left": f"Paragraph number {i}", "text_left_report": [], "ratio": 1.0}
+               for i in range(5000)]
+
+    temp_store.cache_result("task", dataset)
+
+    assert provider["result:task"][:1] == COMPRESSED_MARK
+    assert temp_store.get_result("task") == dataset
+
+
+def test_request_task_is_remembered_with_result():
+    """
+    Test task of a request is found once its result is cached
+    """
+    temp_store = TempStorage(ProviderStub())
+
+    assert temp_store.get_request_task("request") is None
+
+    temp_store.cache_result("task", [], request_key="request")
+
+    assert temp_store.get_request_task("request") == "task"
+    assert temp_store.get_request_task("other") is None
+
+
+def test_progress_without_refresh_keeps_expiry():
+    """
+    Test progress without refresh_ttl sets expiry only when the task has none
+    """
+    provider = ProviderStub()
+    temp_store = TempStorage(provider)
+
+    temp_store.cache_progress("task", 40, refresh_ttl=False)
+
+    assert provider["pipelines"] == [[
+        ("hset", "task:task", {"progress": 40, "status": "processing"}),
+        ("expire", "task:task", TASK_TTL, True)]]
+
+
+def test_parse_conn_string():
+    """
+    Test host, port and password connection string becomes Redis URL
+    """
+    conn_string = "cache.example.net:6380,password=secret=,ssl=True,abortConnect=False"
+
+    assert (parse_conn_string(conn_string) ==
+            "rediss://:secret=@cache.example.net:6380/0?ssl_cert_reqs=required")
+    assert parse_conn_string("redis://127.0.0.1:6379") == "redis://127.0.0.1:6379"
+    assert parse_conn_string("cache.example.net:6380") == "cache.example.net:6380"
@@ -0,0 +1,65 @@
+"""
+Module to test saving of uploaded files
+"""
+
+import os
+from io import BytesIO
+
+import tempfile
+
+import anyio
+import pytest
+from fastapi import BackgroundTasks, HTTPException, UploadFile
+
+from routers.compare import save_upload_file_tmp, start_task
+from use_cases.compare_documents import get_content_hash
+
+
+def test_upload_hash_same_as_content_hash():
+    """
+    Test hash made while saving upload is the one used to find parsed paragraphs
+    """
+    content = b"%PDF-1.4 document content" * 100000
+
+    tmp_path, content_hash = anyio.run(save_upload_file_tmp,
+                                       UploadFile(BytesIO(content), filename="doc.pdf"))
+    try:
+        assert tmp_path.endswith(".pdf")
+        assert content_hash == get_content_hash(tmp_path)
+        assert content_hash == get_content_hash(BytesIO(content))
+    finally:
+        os.remove(tmp_path)
+
+
+class FailingFile(BytesIO):
+    """
+    File that fails after the first chunk was read
+    """
+
+    def read(self, size=-1):
+        """
+        Read chunk or fail
+        """
+        if self.tell():
+            raise OSError("connection lost")
+        return super().read(size)
+
+
+def test_failed_upload_leaves_no_files(tmp_path, monkeypatch):
+    """
+    Test saved file is removed when the other upload fails
+    """
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    async def upload_both(right_file):
+        await start_task(BackgroundTasks(), None, 40, 40, 0.8, 40, 40, 0.8, 0.5, 30,  # type: ignore
+                         "", "", "", "",
+                         UploadFile(BytesIO(b"left content"), filename="left.pdf"),
+                         right_file)
+
+    with pytest.raises(HTTPException):
+        anyio.run(upload_both, UploadFile(BytesIO(b"right content")))
+    with pytest.raises(OSError):
+        anyio.run(upload_both, UploadFile(FailingFile(b"x" * (3 << 20)), filename="right.pdf"))
+
+    assert not os.listdir(tmp_path)
@@ -2,18 +2,98 @@
 Use case to compare to documents
 """
 
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
 from io import BufferedReader, BytesIO
-from typing import BinaryIO, Union
+from typing import BinaryIO, List, Tuple, Union
 
+from document_comparer.paragraph import Paragraph
 from document_comparer.text_matcher import TextMatcher
-from internal.constants import COMPLETE_FIRST, INIT_PROGRESS, COMPLETE_SECOND
+from internal.constants import (COMPLETE_FIRST, INIT_PROGRESS, COMPLETE_SECOND,
+                                PARAGRAPH_CACHE_SIZE)
 from internal.notifier import Notifier, ThresholdNotifier
+from internal.process_pool import get_process_pool, reset_process_pool
 from internal.schemas import CompareRequest, CompareRequestSingle
 from use_cases.processor_factory import create_document_processor
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+
+DocumentKey = Tuple[str, str, str]
+_paragraph_cache: "OrderedDict[DocumentKey, List[Paragraph]]" = OrderedDict()
+_paragraph_cache_lock = threading.Lock()
+
+
+def extract_paragraphs(file: Union[BufferedReader, BytesIO, str, BinaryIO],
+                       args: CompareRequestSingle,
+                       file_type: str,
+                       threshold_notifier: ThresholdNotifier) -> List[Paragraph]:
+    """
+    Extract paragraphs from one document
+    """
+    return create_document_processor(file, args, file_type,
+                                     threshold_notifier).extract_paragraphs()
+
+
+def new_content_hash() -> hashlib.blake2b:
+    """
+    Create hash object for document content
+    """
+    return hashlib.blake2b(digest_size=16)
+
+
+def get_content_hash(file: Union[BufferedReader, BytesIO, str, BinaryIO]) -> str:
+    """
+    Get hash of the document content without making a copy of it
+    """
+    if isinstance(file, str):
+        with open(file, "rb") as file_object:
+            return hashlib.file_digest(file_object, new_content_hash).hexdigest()
+    position = file.tell()
+    content_hash = hashlib.file_digest(file, new_content_hash).hexdigest()
+    file.seek(position)
+    return content_hash
+
+
+def get_cache_key(file: Union[BufferedReader, BytesIO, str, BinaryIO],
+                  args: CompareRequestSingle,
+                  file_type: str,
+                  content_hash: str | None = None) -> DocumentKey:
+    """
+    Get key of parsed document: content hash, type and extraction settings.
+    Content hash made while the file was received can be passed with content_hash
+    """
+    if content_hash is None:
+        content_hash = get_content_hash(file)
+    return content_hash, file_type, args.model_dump_json()
+
+
+def get_cached_paragraphs(key: DocumentKey) -> List[Paragraph] | None:
+    """
+    Get copies of cached paragraphs, comparison changes their payloads
+    """
+    with _paragraph_cache_lock:
+        paragraphs = _paragraph_cache.get(key)
+        if paragraphs is None:
+            return None
+        _paragraph_cache.move_to_end(key)
+    return [Paragraph(para.text, para.id, dict(para.payload)) for para in paragraphs]
+
+
+def cache_paragraphs(key: DocumentKey,
+                     paragraphs: List[Paragraph]) -> List[Paragraph]:
+    """
+    Cache parsed paragraphs and return copies to work with
+    """
+    with _paragraph_cache_lock:
+        _paragraph_cache[key] = paragraphs
+        _paragraph_cache.move_to_end(key)
+        while len(_paragraph_cache) > PARAGRAPH_CACHE_SIZE:
+            _paragraph_cache.popitem(last=False)
+    return [Paragraph(para.text, para.id, dict(para.payload)) for para in paragraphs]
 
 
 def compare_documents(left_file: Union[BufferedReader, BytesIO, str, BinaryIO],
@@ -22,33 +102,71 @@ def compare_documents(left_file: Union[BufferedReader, BytesIO, str, BinaryIO],
                       right_file_type: str,
                       args: CompareRequest,
                       notifier: Notifier = Notifier(None, None),
-                      mode: str = "html"):
+                      mode: str = "html",
+                      left_hash: str | None = None,
+                      right_hash: str | None = None):
     """
-    Compare documents and get comparison report
+    Compare documents and get comparison report.
+    Content hashes of the files (see get_content_hash) can be passed
+    with left_hash and right_hash to avoid reading the files again
     """
     logger.info("Split pdf into paragraphs")
-    threshold_notifier = ThresholdNotifier(notifier=notifier,
-                                           lower=INIT_PROGRESS,
-                                           upper=COMPLETE_FIRST)
-    left_paragraphs = create_document_processor(left_file,
-                                                CompareRequestSingle(header=args.header_left,
-                                                                     footer=args.footer_left,
-                                                                     size_weight=args.size_weight_left,
-                                                                     text_column=args.text_column_left,
-                                                                     id_column=args.id_column_left),
+    # Values are taken from the validated request, no need to validate them again
+    left_args = CompareRequestSingle.model_construct(header=args.header_left,
+                                                     footer=args.footer_left,
+                                                     size_weight=args.size_weight_left,
+                                                     text_column=args.text_column_left,
+                                                     id_column=args.id_column_left)
+    right_args = CompareRequestSingle.model_construct(header=args.header_right,
+                                                      footer=args.footer_right,
+                                                      size_weight=args.size_weight_right,
+                                                      text_column=args.text_column_right,
+                                                      id_column=args.id_column_right)
+    left_key = get_cache_key(left_file, left_args, left_file_type, left_hash)
+    right_key = get_cache_key(right_file, right_args, right_file_type, right_hash)
+    left_paragraphs = get_cached_paragraphs(left_key)
+    right_paragraphs = get_cached_paragraphs(right_key)
+    logger.info("Paragraphs taken from cache: left %s, right %s",
+                left_paragraphs is not None, right_paragraphs is not None)
+
+    if (left_paragraphs is None and right_paragraphs is None
+            and left_file_type == right_file_type == "pdf" and (os.cpu_count() or 1) > 1):
+        # PDF parsing holds the GIL, so the left document is parsed
+        # in a worker process while the right one is parsed here.
+        # Progress of both is reported by the right document
+        if not isinstance(left_file, (str, BytesIO)):
+            left_file = BytesIO(left_file.read())
+        left_future = get_process_pool().submit(extract_paragraphs, left_file, left_args,
                                                 left_file_type,
-                                                threshold_notifier).extract_paragraphs()
-    threshold_notifier = ThresholdNotifier(notifier=notifier,
-                                           lower=COMPLETE_FIRST,
-                                           upper=COMPLETE_SECOND)
-    right_paragraphs = create_document_processor(right_file,
-                                                 CompareRequestSingle(header=args.header_right,
-                                                                      footer=args.footer_right,
-                                                                      size_weight=args.size_weight_right,
-                                                                      text_column=args.text_column_right,
-                                                                      id_column=args.id_column_right),
-                                                 right_file_type,
-                                                 threshold_notifier).extract_paragraphs()
+                                                ThresholdNotifier(notifier=Notifier(None, None),
+                                                                  lower=0, upper=0))
+        try:
+            right_paragraphs = cache_paragraphs(
+                right_key, extract_paragraphs(right_file, right_args, right_file_type,
+                                              ThresholdNotifier(notifier=notifier,
+                                                                lower=INIT_PROGRESS,
+                                                                upper=COMPLETE_SECOND)))
+        except BaseException:
+            # Left document is not needed anymore, free the worker if it has not started
+            left_future.cancel()
+            raise
+        try:
+            left_paragraphs = cache_paragraphs(left_key, left_future.result())
+        except BrokenProcessPool:
+            reset_process_pool()
+            raise
+    if left_paragraphs is None:
+        left_paragraphs = cache_paragraphs(
+            left_key, extract_paragraphs(left_file, left_args, left_file_type,
+                                         ThresholdNotifier(notifier=notifier,
+                                                           lower=INIT_PROGRESS,
+                                                           upper=COMPLETE_FIRST)))
+    if right_paragraphs is None:
+        right_paragraphs = cache_paragraphs(
+            right_key, extract_paragraphs(right_file, right_args, right_file_type,
+                                          ThresholdNotifier(notifier=notifier,
+                                                            lower=COMPLETE_FIRST,
+                                                            upper=COMPLETE_SECOND)))
     logger.info("Make comparison")
     comparison = TextMatcher(left_paragraphs,
                              right_paragraphs,
@@ -2,6 +2,8 @@
 Module to create file processor
 """
 
+import os
+from importlib import import_module
 from io import BufferedReader, BytesIO
 from typing import BinaryIO, Union
 
@@ -11,6 +13,11 @@ from internal.schemas import CompareRequestSingle
 from document_comparer.pdf_processor import PDFProcessor
 from document_comparer.excel_processor import ExcelProcessor
 
+FILE_EXTENSIONS = {".xlsx": "excel", ".pdf": "pdf"}
+CONTENT_TYPES = {"application/pdf": "pdf",
+                 "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "excel",
+                 "application/vnd.ms-excel": "excel"}
+
 
 def create_document_processor(file_object: Union[BufferedReader, BytesIO, str, BinaryIO],
                               args: CompareRequestSingle, mode: str,
@@ -30,30 +37,26 @@ def create_document_processor(file_object: Union[BufferedReader, BytesIO, str, B
     raise ValueError('Processing mode should be either "excel" or "pdf"')
 
 
+def warmup_processors():
+    """
+    Import modules that processors load lazily on first use,
+    so the first request does not wait for them
+    """
+    # pandas imports its Excel engine only when the first file is read
+    import_module("openpyxl")
+
+
 def detect_file_type(upload_file: UploadFile) -> str:
     """
-    Detect file type xlsx or pdf by content type
+    Detect file type xlsx or pdf by content type,
+    falling back to the file name for unknown content types
     """
-    content_type = upload_file.content_type
-    if content_type == "application/pdf":
-        return "pdf"
-    if content_type in ["application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        "application/vnd.ms-excel"]:
-        return "excel"
-    return "unknown"
+    return (CONTENT_TYPES.get(upload_file.content_type or "")
+            or detect_file_type_on_name(upload_file.filename or ""))
 
 
 def detect_file_type_on_name(filename: str) -> str:
     """
     Detect file type on file name
     """
-    try:
-        pos = filename.rfind('.')
-        extension = filename[pos+1:]
-        if extension == 'xlsx':
-            return 'excel'
-        elif extension == 'pdf':
-            return 'pdf'
-        return 'unknown'
-    except ValueError as ex:
-        raise ValueError('File must have "xlsx" or "pdf" type') from ex
+    return FILE_EXTENSIONS.get(os.path.splitext(filename)[1], "unknown")